@@ -1,11 +1,107 @@
 """Configuration management for Move Me."""
 
-import json
+import functools
 import os
+import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
-
-import yaml
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from move_me.utils.fileio import read_json, write_json
+
+# (key, JSON type, minimum, exclusive minimum, requirement) for each required
+# setting, checked in order by validate_config.
+_VALIDATION_RULES: Tuple[Tuple[str, str, int, bool, str], ...] = (
+    ("work_duration_minutes", "number", 0, True, "a positive number"),
+    ("break_duration_minutes", "number", 0, True, "a positive number"),
+    ("warning_time_seconds", "number", 0, True, "a positive number"),
+    ("daily_override_limit", "integer", 0, False, "a non-negative integer"),
+)
+
+
+def _is_json_type(value: Any, json_type: str) -> bool:
+    """Check a value against a JSON "number" or "integer" type.
+
+    As in JSON Schema, booleans are not numbers and integral floats such as
+    3.0 are integers.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return False
+    if json_type == "integer":
+        return isinstance(value, int) or value.is_integer()
+    return True
+
+
+def _config_error(config: Dict[str, Any]) -> Optional[str]:
+    """Describe the first rule the config breaks, or None if it is valid."""
+    for key, json_type, minimum, exclusive, requirement in _VALIDATION_RULES:
+        if key not in config:
+            return f"Missing required configuration key: {key}"
+
+        value = config[key]
+        if not _is_json_type(value, json_type):
+            return f"{key} must be {requirement}"
+        # Written so that NaN fails both comparisons
+        in_range = value > minimum if exclusive else value >= minimum
+        if not in_range:
+            return f"{key} must be {requirement}"
+
+    return None
+
+
+def _freeze_messages(messages: Iterable[Any]) -> Tuple[str, ...]:
+    """Convert overlay messages to a tuple of interned strings."""
+    return tuple(sys.intern(str(message)) for message in messages)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file.
+
+    PyYAML is imported on first use so JSON-only runs don't pay for it.
+    """
+    import yaml
+
+    try:
+        # libyaml-backed loader; PyYAML wheels normally bundle it
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader  # type: ignore[assignment]
+
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=loader)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_config() -> Dict[str, Any]:
+    """Load default configuration from package.
+
+    Cached for the lifetime of the process; callers must not mutate the
+    returned dict. ``overlay_messages`` is stored as a tuple of interned
+    strings so it can be shared safely between merged configs.
+    """
+    default_path = Path(__file__).parent / "default_config.json"
+    try:
+        config = read_json(default_path)
+    except FileNotFoundError:
+        # Fallback if default config not found
+        config = {
+            "work_duration_minutes": 45,
+            "break_duration_minutes": 5,
+            "warning_time_seconds": 30,
+            "daily_override_limit": 3,
+            "notification_sound": True,
+            "log_level": "INFO",
+            "auto_start": False,
+            "auto_lock_enabled": True,
+            "state_file": "move_me_state.json",
+            "overlay_messages": [
+                "Superset A: \nHeavy: 6-12 Pull-ups + 15-30 ATG Split Squats, \nLight: 6-12 Pull-ups + 8-20 Wall-assisted Sissy Squats",
+                "Superset B: \nHeavy: 6-12 Parallel Bar Leg-Assisted Dips + 8-20 Box Leg Curls, \nLight: 6-12 Parallel Bar Leg-Assisted Dips + 8-20 Wall-assisted Sissy Squats",
+                "Superset C: \nHeavy: 8-15 Inverted Ring Rows + 8-15 Push-ups, \nLight: 8-15 Inverted Ring Rows + 8-20 Wall-assisted Sissy Squats",
+            ],
+        }
+
+    config["overlay_messages"] = _freeze_messages(config.get("overlay_messages", ()))
+    return config
 
 
 class ConfigManager:
@@ -14,110 +110,59 @@ class ConfigManager:
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "move-me"
         self.config_file = self.config_dir / "config.json"
-        self.default_config = self._load_default_config()
-
-    def _load_default_config(self) -> Dict[str, Any]:
-        """Load default configuration from package."""
-        default_path = Path(__file__).parent / "default_config.json"
-        try:
-            with open(default_path, "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # Fallback if default config not found
-            return {
-                "work_duration_minutes": 45,
-                "break_duration_minutes": 5,
-                "warning_time_seconds": 30,
-                "daily_override_limit": 3,
-                "notification_sound": True,
-                "log_level": "INFO",
-                "auto_start": False,
-                "auto_lock_enabled": True,
-                "state_file": "move_me_state.json",
-                "overlay_messages": [
-                    "Superset A: \nHeavy: 6-12 Pull-ups + 15-30 ATG Split Squats, \nLight: 6-12 Pull-ups + 8-20 Wall-assisted Sissy Squats",
-                    "Superset B: \nHeavy: 6-12 Parallel Bar Leg-Assisted Dips + 8-20 Box Leg Curls, \nLight: 6-12 Parallel Bar Leg-Assisted Dips + 8-20 Wall-assisted Sissy Squats",
-                    "Superset C: \nHeavy: 8-15 Inverted Ring Rows + 8-15 Push-ups, \nLight: 8-15 Inverted Ring Rows + 8-20 Wall-assisted Sissy Squats",
-                ],
-            }
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+        self.default_config = _load_default_config()
 
     def load_config(self, config_path: Optional[Path] = None) -> Dict[str, Any]:
-        """Load configuration from file or create default."""
-        config = self.default_config.copy()
+        """Load configuration from file or create default.
 
+        ``overlay_messages`` is always returned as a tuple of interned
+        strings and may be shared with the cached defaults.
+        """
         # Load from specified path or default location
         load_path = config_path or self.config_file
 
         if load_path.exists():
             try:
-                with open(load_path, "r") as f:
-                    if load_path.suffix.lower() in [".yml", ".yaml"]:
-                        user_config = yaml.safe_load(f)
-                    else:
-                        user_config = json.load(f)
+                if load_path.suffix.lower() in [".yml", ".yaml"]:
+                    user_config = _load_yaml(load_path)
+                else:
+                    user_config = read_json(load_path)
 
                 # Merge user config with defaults
-                config.update(user_config)
-            except (json.JSONDecodeError, yaml.YAMLError, Exception) as e:
+                config = {**self.default_config, **(user_config or {})}
+                if "overlay_messages" in (user_config or {}):
+                    config["overlay_messages"] = _freeze_messages(
+                        config["overlay_messages"]
+                    )
+                return config
+            except Exception as e:
+                # Covers JSON/YAML syntax errors as well as I/O failures
                 print(f"Warning: Error loading config from {load_path}: {e}")
                 print("Using default configuration.")
         else:
             # Create default config file
-            self.save_config(config, load_path)
+            self.save_config(self.default_config, load_path)
 
-        return config
+        return dict(self.default_config)
 
     def save_config(
         self, config: Dict[str, Any], config_path: Optional[Path] = None
     ) -> None:
         """Save configuration to file."""
         save_path = config_path or self.config_file
-        save_path.parent.mkdir(parents=True, exist_ok=True)
+        # The config directory is created in __init__; only custom
+        # locations need their parent created here.
+        if save_path.parent != self.config_dir:
+            save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(save_path, "w") as f:
-            json.dump(config, f, indent=2)
+        write_json(save_path, config)
 
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate configuration values."""
-        required_keys = [
-            "work_duration_minutes",
-            "break_duration_minutes",
-            "warning_time_seconds",
-            "daily_override_limit",
-        ]
-
-        for key in required_keys:
-            if key not in config:
-                print(f"Error: Missing required configuration key: {key}")
-                return False
-
-        # Validate types and ranges
-        if (
-            not isinstance(config["work_duration_minutes"], (int, float))
-            or config["work_duration_minutes"] <= 0
-        ):
-            print("Error: work_duration_minutes must be a positive number")
-            return False
-
-        if (
-            not isinstance(config["break_duration_minutes"], (int, float))
-            or config["break_duration_minutes"] <= 0
-        ):
-            print("Error: break_duration_minutes must be a positive number")
-            return False
-
-        if (
-            not isinstance(config["warning_time_seconds"], (int, float))
-            or config["warning_time_seconds"] <= 0
-        ):
-            print("Error: warning_time_seconds must be a positive number")
-            return False
-
-        if (
-            not isinstance(config["daily_override_limit"], int)
-            or config["daily_override_limit"] < 0
-        ):
-            print("Error: daily_override_limit must be a non-negative integer")
+        error = _config_error(config)
+        if error is not None:
+            print(f"Error: {error}")
             return False
 
         return True
@@ -1,31 +1,67 @@
 """Cross-platform notification management for Move Me."""
 
-try:
-    from plyer import notification
-
-    PLYER_AVAILABLE = True
-except ImportError:
-    PLYER_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
 
 from move_me.utils.logger import get_logger
 
+# plyer is imported on first notification rather than at module import
+_plyer_notification: Optional[Any] = None
+_plyer_checked = False
+
+
+def _get_plyer_notification() -> Optional[Any]:
+    """Import plyer's notification facade once, or None if unavailable."""
+    global _plyer_notification, _plyer_checked
+
+    if not _plyer_checked:
+        _plyer_checked = True
+        try:
+            from plyer import notification
+
+            _plyer_notification = notification
+        except ImportError:
+            get_logger().warning(
+                "Plyer not available, notifications will fall back to console output"
+            )
+
+    return _plyer_notification
+
 
 class NotificationManager:
     """Manages cross-platform notifications."""
 
+    # Fixed notification text, shared by all instances
+    COUNTDOWN_TITLE = "Break Time Approaching"
+    BREAK_STARTING_TITLE = "Break Time!"
+    BREAK_ENDING_TITLE = "Break Complete"
+    BREAK_ENDING_MESSAGE = "Break time is over. Welcome back!"
+    OVERRIDE_TITLE = "Break Skipped"
+    NO_OVERRIDES_MESSAGE = "Break skipped. No more overrides available today."
+    ERROR_TITLE = "Move Me Error"
+    STATUS_TITLE = "Move Me Status"
+
     def __init__(self, app_name: str = "Move Me", enable_sound: bool = True):
         self.app_name = app_name
         self.enable_sound = enable_sound
         self.logger = get_logger()
+        # Notifications are delivered from a single background thread so a
+        # slow notification daemon never blocks the timer's event loop. One
+        # worker keeps them in order; created on first use.
+        self._executor: Optional[ThreadPoolExecutor] = None
 
-        if not PLYER_AVAILABLE:
-            self.logger.warning(
-                "Plyer not available, notifications will fall back to console output"
+    def show_notification(self, title: str, message: str, timeout: int = 5) -> None:
+        """Show a system notification without waiting for it to be delivered."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="move-me-notify"
             )
+        self._executor.submit(self._deliver_notification, title, message, timeout)
 
-    def show_notification(self, title: str, message: str, timeout: int = 5) -> None:
-        """Show a system notification."""
-        if PLYER_AVAILABLE:
+    def _deliver_notification(self, title: str, message: str, timeout: int) -> None:
+        """Deliver a notification (runs in the notification thread)."""
+        notification = _get_plyer_notification()
+        if notification is not None:
             try:
                 notification.notify(
                     title=title,
@@ -33,7 +69,7 @@ class NotificationManager:
                     app_name=self.app_name,
                     timeout=timeout,
                 )
-                self.logger.debug(f"Notification shown: {title} - {message}")
+                self.logger.debug("Notification shown: %s - %s", title, message)
                 return
             except Exception as e:
                 self.logger.error(f"Failed to show notification: {e}")
@@ -48,49 +84,46 @@ class NotificationManager:
         else:
             time_str = f"{seconds_remaining} second(s)"
 
-        title = "Break Time Approaching"
         message = f"Screen will lock in {time_str}"
 
         # Use shorter timeout for more urgent warnings
         timeout = 3 if seconds_remaining <= 10 else 5
 
-        self.show_notification(title, message, timeout=timeout)
+        self.show_notification(self.COUNTDOWN_TITLE, message, timeout=timeout)
 
     def show_break_starting(self, duration_minutes: int) -> None:
         """Show notification when break starts."""
-        title = "Break Time!"
         message = f"Taking a {duration_minutes}-minute break. Screen is now locking."
 
-        self.show_notification(title, message, timeout=3)
+        self.show_notification(self.BREAK_STARTING_TITLE, message, timeout=3)
+
+    def show_break_ending(self, remaining_overrides: Optional[int] = None) -> None:
+        """Show notification when break ends.
 
-    def show_break_ending(self) -> None:
-        """Show notification when break ends."""
-        title = "Break Complete"
-        message = "Break time is over. Welcome back!"
+        If remaining_overrides is positive, it is included in the same
+        notification rather than sent as a separate status message.
+        """
+        message = self.BREAK_ENDING_MESSAGE
+        if remaining_overrides:
+            message = f"{message}\n{remaining_overrides} overrides remaining today"
 
-        self.show_notification(title, message, timeout=3)
+        self.show_notification(self.BREAK_ENDING_TITLE, message, timeout=3)
 
     def show_override_used(self, remaining_overrides: int) -> None:
         """Show notification when override is used."""
-        title = "Break Skipped"
         if remaining_overrides > 0:
             message = (
                 f"Break skipped. {remaining_overrides} override(s) remaining today."
             )
         else:
-            message = "Break skipped. No more overrides available today."
+            message = self.NO_OVERRIDES_MESSAGE
 
-        self.show_notification(title, message, timeout=5)
+        self.show_notification(self.OVERRIDE_TITLE, message, timeout=5)
 
     def show_error(self, error_message: str) -> None:
         """Show error notification."""
-        title = "Move Me Error"
-        message = error_message
-
-        self.show_notification(title, message, timeout=10)
+        self.show_notification(self.ERROR_TITLE, error_message, timeout=10)
 
     def show_status(self, message: str) -> None:
         """Show status notification."""
-        title = "Move Me Status"
-
-        self.show_notification(title, message, timeout=3)
+        self.show_notification(self.STATUS_TITLE, message, timeout=3)
@@ -16,15 +16,73 @@ Color and Design Improvements:
 - Consistent color usage throughout interface
 """
 
+from __future__ import annotations
+
+import atexit
+import contextlib
 import os
 import random
-import tkinter as tk
-import tkinter.font as tkfont
-from datetime import datetime
-from typing import Callable, List, Literal, Optional, Tuple
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from move_me.utils.logger import get_logger
 
+# tkinter is imported where it is used so that importing this module (e.g.
+# for --dry-run or the status command) doesn't load Tcl/Tk.
+if TYPE_CHECKING:
+    import tkinter as tk
+    import tkinter.font as tkfont
+
+# Overlays are created for every break; look the logger up once
+logger = get_logger()
+
+
+def _has_display() -> bool:
+    """Check the environment variables used by X11 and Wayland."""
+    return any(
+        key in os.environ for key in ("DISPLAY", "WAYLAND_DISPLAY", "XDG_RUNTIME_DIR")
+    )
+
+
+# Fixed overlay text, shared by every break
+_WARNING_TEXT = (
+    "This overlay will prevent interaction with your system until the break is complete.\n"
+    "Use the override button only when absolutely necessary."
+)
+_BREAK_COMPLETE_TEXT = "Break complete! Click the button below to resume work."
+
+
+class OverlayFontSizes(NamedTuple):
+    """Font sizes used by the overlay."""
+
+    title: int = 32  # Main message
+    timer: int = 56  # Timer display
+    button: int = 16  # Button text
+    warning: int = 12  # Warning text
+
+
+class OverlayColors(NamedTuple):
+    """Color scheme used by the overlay."""
+
+    background: str = "#2c3e50"  # Dark blue-gray
+    text_primary: str = "#ecf0f1"  # Light gray-white
+    text_secondary: str = "#bdc3c7"  # Medium gray
+    timer_active: str = "#e74c3c"  # Red for countdown
+    timer_complete: str = "#27ae60"  # Green when done
+    button_bg: str = "#e67e22"  # Orange button
+    button_hover: str = "#d35400"  # Darker orange on hover
+    button_text: str = "#ffffff"  # White button text
+
 
 class OverlayConfig:
     """Configuration class for overlay appearance."""
@@ -42,29 +100,34 @@ class OverlayConfig:
         "fallback": ["TkDefaultFont"],  # System fallback
     }
 
-    FONT_SIZES = {
-        "title": 32,  # Main message
-        "timer": 56,  # Timer display
-        "button": 16,  # Button text
-        "warning": 12,  # Warning text
-    }
+    FONT_SIZES = OverlayFontSizes()
 
-    COLORS = {
-        "background": "#2c3e50",  # Dark blue-gray
-        "text_primary": "#ecf0f1",  # Light gray-white
-        "text_secondary": "#bdc3c7",  # Medium gray
-        "timer_active": "#e74c3c",  # Red for countdown
-        "timer_complete": "#27ae60",  # Green when done
-        "button_bg": "#e67e22",  # Orange button
-        "button_hover": "#d35400",  # Darker orange on hover
-        "button_text": "#ffffff",  # White button text
-    }
+    COLORS = OverlayColors()
+
+    # Resolved family per font type. Whether a family is installed doesn't
+    # depend on size or weight, so each type is only probed once.
+    _family_cache: Dict[str, str] = {}
 
     @staticmethod
     def get_best_font(
         font_type: str, size: int, weight: Literal["normal", "bold"] = "normal"
     ) -> Tuple[str, int, str]:
-        """Get the best available font for the given type."""
+        """Get the best available font for the given type.
+
+        The family is cached per process since probing fonts requires several
+        round-trips to the Tcl interpreter.
+        """
+        family = OverlayConfig._family_cache.get(font_type)
+        if family is None:
+            family = OverlayConfig._probe_family(font_type)
+            OverlayConfig._family_cache[font_type] = family
+        return (family, size, weight)
+
+    @staticmethod
+    def _probe_family(font_type: str) -> str:
+        """Find the first installed family for the given font type."""
+        import tkinter as tk
+        import tkinter.font as tkfont
 
         families = OverlayConfig.FONT_FAMILIES.get(
             font_type, OverlayConfig.FONT_FAMILIES["primary"]
@@ -73,37 +136,74 @@ class OverlayConfig:
         for family in families:
             try:
                 # Create a test font to verify it exists
-                test_font = tkfont.Font(family=family, size=size, weight=weight)
+                test_font = tkfont.Font(family=family)
                 if test_font.actual("family").lower() == family.lower():
-                    return (family, size, weight)
+                    return family
             except (tk.TclError, Exception):
                 continue
 
         # Final fallback
-        return (families[-1], size, weight)
+        return families[-1]
+
+
+class _OverlayWidgets(NamedTuple):
+    """Widgets making up the overlay, kept on the shared Tk root."""
+
+    frame: tk.Frame
+    message_label: tk.Label
+    timer_label: tk.Label
+    override_button: tk.Button
+    warning_label: tk.Label
+    resume_button: tk.Button
 
 
 class LinuxBreakOverlay:
     """GUI overlay that prevents user interaction during breaks."""
 
+    # Tk root shared by every overlay in the process. It is created on the
+    # first break, withdrawn between breaks and only destroyed at exit, so
+    # Tcl/Tk start-up and the X11 connection are paid for once.
+    _shared_root: Optional[tk.Tk] = None
+    # Ident of the thread that created the shared root; Tk calls must be
+    # made from this thread
+    _root_thread: Optional[int] = None
+    # Font objects belong to the shared root's interpreter
+    _shared_fonts: Dict[Tuple[str, int, str], tkfont.Font] = {}
+    # Widgets on the shared root, built on the first break and reused while
+    # overlays use the same colours and font sizes
+    _shared_widgets: Optional[_OverlayWidgets] = None
+    _widgets_style: Optional[Tuple[OverlayColors, OverlayFontSizes]] = None
+    # Overlay currently shown; the shared buttons' commands are sent to it
+    _active: Optional[LinuxBreakOverlay] = None
+
     def __init__(
         self,
-        messages: List[str],
+        messages: Sequence[str],
         break_duration_seconds: int,
         on_override: Optional[Callable] = None,
         config: Optional[OverlayConfig] = None,
+        rng: Optional[random.Random] = None,
     ):
         self.messages = messages
         self.break_duration_seconds = break_duration_seconds
         self.on_override = on_override
         self.config = config or OverlayConfig()
-        self.logger = get_logger()
-
-        self.is_showing = False
-        self.start_time: Optional[datetime] = None
-        self._resume_button_shown = False
+        self.logger = logger
+        # Pass a seeded Random to make the message choice reproducible
+        self._rng = rng or random.Random()
+
+        # Set while the overlay is up. hide_overlay() may be called from
+        # another thread than the one running the mainloop.
+        self._showing = threading.Event()
+        # time.monotonic() at which the break is over
+        self._end_time: Optional[float] = None
+        self._last_displayed_seconds: Optional[int] = None
+        self._message = ""
+        self._timer_after_id: Optional[str] = None
+        self._complete_after_id: Optional[str] = None
 
         # UI elements
+        self._thread_root: Optional[tk.Tk] = None
         self.message_label: Optional[tk.Label] = None
         self.timer_label: Optional[tk.Label] = None
         self.override_button: Optional[tk.Button] = None
@@ -117,210 +217,288 @@ class LinuxBreakOverlay:
         returns without raising exceptions.
         """
 
-        if self.is_showing:
+        if self._showing.is_set():
             return
 
         # Avoid Tcl/Tk errors in headless environments by checking common
         # display environment variables used by X11 and Wayland.
-        if not any(
-            key in os.environ
-            for key in ("DISPLAY", "WAYLAND_DISPLAY", "XDG_RUNTIME_DIR")
-        ):
+        if not _has_display():
             self.logger.error("No graphical display detected; cannot show overlay")
             return
 
-        # Mark as showing and record start time
-        self.is_showing = True
-        self.start_time = datetime.now()
-        self._resume_button_shown = False
+        # Mark as showing and record when the break ends
+        self._showing.set()
+        self._end_time = time.monotonic() + self.break_duration_seconds
+        self._last_displayed_seconds = None
+        self._message = self.messages[self._rng.randrange(len(self.messages))]
 
         # Run overlay in the current thread. Tkinter is not thread-safe so the
         # Tk root must be created and run in the main/calling thread.
-        self._should_quit = False
         self._run_overlay()
 
-    def _run_overlay(self):
-        """Run the overlay in a separate thread with its own Tk instance."""
+    @classmethod
+    def prewarm(cls) -> None:
+        """Create the shared Tk root and resolve fonts ahead of the first break.
+
+        Takes Tcl/Tk start-up and font probing off the path between the
+        break starting and the overlay appearing. Must be called on the
+        thread that will show the overlay; does nothing without a display.
+        """
+        if not _has_display():
+            return
+
+        try:
+            cls._get_root()
+            sizes = OverlayConfig.FONT_SIZES
+            OverlayConfig.get_best_font("primary", sizes.title)
+            OverlayConfig.get_best_font("monospace", sizes.timer)
+        except Exception as e:
+            # The first break will try again, and report any error then
+            logger.debug(f"Could not prewarm overlay: {e}")
+
+    @classmethod
+    def _get_root(cls) -> tk.Tk:
+        """Get the shared Tk root, creating it on first use."""
+        import tkinter as tk
+
+        root = cls._shared_root
+        if root is not None:
+            return root
+
+        root = tk.Tk()
+        # Stay hidden until an overlay is actually shown
+        root.withdraw()
+        root.title("Move Me - Break Time")
+
+        # Try Linux-specific attributes
         try:
-            root = tk.Tk()
-            root.title("Move Me - Break Time")
-            root.configure(bg=self.config.COLORS["background"])
+            root.attributes("-type", "splash")
+        except tk.TclError:
+            pass
+
+        root.overrideredirect(True)
+
+        # Swallow all key and button events with a plain Tcl "break" script,
+        # so blocking input never calls into Python. The root's tag comes
+        # after the widget class in every widget's bindtags, so the buttons
+        # still work. <Key> and <Button> are the same patterns as <KeyPress>
+        # and <ButtonPress>. Pointer motion is left alone: the global grab
+        # already keeps it from reaching other windows.
+        for sequence in ("<Key>", "<KeyRelease>", "<Button>", "<ButtonRelease>"):
+            root.tk.call("bind", str(root), sequence, "break")
+
+        cls._shared_root = root
+        cls._root_thread = threading.get_ident()
+        atexit.register(cls._destroy_root)
+        return root
+
+    @classmethod
+    def _destroy_root(cls) -> None:
+        """Destroy the shared Tk root and everything tied to it."""
+        root = cls._shared_root
+        cls._shared_root = None
+        cls._root_thread = None
+        cls._shared_fonts.clear()
+        cls._shared_widgets = None
+        cls._widgets_style = None
+        cls._active = None
+        if root is not None:
+            with contextlib.suppress(Exception):
+                root.destroy()
+
+    def _get_font(
+        self, font_type: str, size: int, weight: Literal["normal", "bold"]
+    ) -> tkfont.Font:
+        """Get a shared Font object for the best available family."""
+        import tkinter.font as tkfont
+
+        family = self.config.get_best_font(font_type, size, weight)[0]
+        key = (family, size, weight)
+        font = self._shared_fonts.get(key)
+        if font is None:
+            font = tkfont.Font(family=family, size=size, weight=weight)
+            self._shared_fonts[key] = font
+        return font
 
-            # Get screen dimensions
-            root.update_idletasks()  # Ensure window is ready
-            screen_width = root.winfo_screenwidth()
-            screen_height = root.winfo_screenheight()
+    def _run_overlay(self):
+        """Show the shared Tk root as the overlay and run its mainloop."""
+        try:
+            root = self._get_root()
+            # Store root reference early so quit requests can reach it
+            self._thread_root = root
+            root.configure(bg=self.config.COLORS.background)
+            root.deiconify()
 
-            # Make window large enough to cover multiple monitors
-            # Use a very large size that should cover most multi-monitor setups
-            extended_width = screen_width * 3  # Cover up to 3 monitors horizontally
-            extended_height = screen_height * 2  # Cover up to 2 monitors vertically
+            # Cover the whole desktop. On X11 the screen (or the window
+            # manager's virtual root, if it uses one) already spans every
+            # monitor, so its size is the multi-monitor bounding box.
+            width = root.winfo_vrootwidth() or root.winfo_screenwidth()
+            height = root.winfo_vrootheight() or root.winfo_screenheight()
 
-            # Position at 0,0 to start from top-left corner
-            root.geometry(f"{extended_width}x{extended_height}+0+0")
+            # Position at 0,0 to start from top-left corner. The window is
+            # override-redirect, so the window manager ignores -fullscreen
+            # below and this geometry is what actually covers the screens.
+            root.geometry(f"{width}x{height}+0+0")
 
             # Make window fullscreen and topmost
             root.attributes("-fullscreen", True)
             root.attributes("-topmost", True)
 
-            # Try Linux-specific attributes
-            try:
-                root.attributes("-type", "splash")
-            except tk.TclError:
-                pass
-
-            root.overrideredirect(True)
+            # The shared root was withdrawn before it was ever shown, so
+            # deiconify() only marks it to be mapped; Tk maps it when idle
+            # tasks run. Do that now, or the focus and grab below fail on a
+            # window that isn't viewable yet.
+            root.update_idletasks()
 
             # Focus and raise the window
             root.focus_force()
             root.lift()
-            root.tkraise()
 
             # Protocol for window close (prevent closing)
             root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
-            # Capture all input events
-            root.bind("<Key>", self._block_input)
-            root.bind("<Button>", self._block_input)
-            root.bind("<Motion>", self._block_input)
-            root.bind("<ButtonPress>", self._block_input)
-            root.bind("<ButtonRelease>", self._block_input)
-            root.bind("<KeyPress>", self._block_input)
-            root.bind("<KeyRelease>", self._block_input)
-
             # Grab keyboard and mouse input
             root.grab_set_global()
             root.focus_set()
 
-            # Store root reference
-            self._thread_root = root
-
             # Populate the overlay
             self._populate_overlay_in_thread(root)
 
-            # Start periodic check for quit signal using after()
-            def check_quit():
-                if self._should_quit:
-                    try:
-                        root.quit()
-                    except Exception:
-                        pass
-                else:
-                    root.after(100, check_quit)  # Check every 100ms
-
-            root.after(100, check_quit)
-
             # Start the mainloop (blocks until window is destroyed or quit())
             root.mainloop()
 
         except Exception as e:
             self.logger.error(f"Error in overlay thread: {e}")
         finally:
-            self.is_showing = False
-            if hasattr(self, "_thread_root"):
+            self._showing.clear()
+            root = self._thread_root
+            self._thread_root = None
+            if root is not None:
                 try:
-                    self._thread_root.destroy()
+                    for after_id in (self._timer_after_id, self._complete_after_id):
+                        if after_id is not None:
+                            root.after_cancel(after_id)
+                    root.grab_release()
+                    # Keep the root and its widgets around for the next break
+                    root.withdraw()
                 except Exception:
-                    pass
-                delattr(self, "_thread_root")
+                    # The root is unusable; the next break creates a new one
+                    self._destroy_root()
+            self._timer_after_id = None
+            self._complete_after_id = None
+            if LinuxBreakOverlay._active is self:
+                LinuxBreakOverlay._active = None
 
     def _populate_overlay_in_thread(self, root):
-        """Populate the overlay with content (runs in overlay thread)."""
-        # Center frame for content
-        center_frame = tk.Frame(root, bg=self.config.COLORS["background"])
-        center_frame.place(relx=0.5, rely=0.5, anchor="center")
-
-        # Create optimized fonts using the configuration
-        title_font = self.config.get_best_font(
-            "primary", self.config.FONT_SIZES["title"], "bold"
-        )
-        timer_font = self.config.get_best_font(
-            "monospace", self.config.FONT_SIZES["timer"], "bold"
-        )
-        button_font = self.config.get_best_font(
-            "primary", self.config.FONT_SIZES["button"], "normal"
-        )
-        warning_font = self.config.get_best_font(
-            "primary", self.config.FONT_SIZES["warning"], "normal"
+        """Set up the shared widgets for this break (runs in overlay thread)."""
+        # Fonts and colours are set when the widgets are built, so rebuild
+        # them if this overlay's config styles them differently
+        style = (self.config.COLORS, self.config.FONT_SIZES)
+        widgets = self._shared_widgets
+        if widgets is None or style != self._widgets_style:
+            if widgets is not None:
+                widgets.frame.destroy()
+            widgets = self._build_widgets(root)
+            LinuxBreakOverlay._shared_widgets = widgets
+            LinuxBreakOverlay._widgets_style = style
+        LinuxBreakOverlay._active = self
+
+        self.message_label = widgets.message_label
+        self.timer_label = widgets.timer_label
+        self.override_button = widgets.override_button
+        self.resume_button = widgets.resume_button
+
+        # Reset whatever the previous break left behind. The timer width is
+        # fixed to the initial text (in characters of the monospace timer
+        # font), so the per-second text changes only redraw the label and
+        # never make Tk recompute the layout of the whole frame.
+        timer_text = self._format_time_remaining()
+        widgets.message_label.config(text=self._message)
+        widgets.timer_label.config(
+            text=timer_text,
+            width=len(timer_text),
+            fg=self.config.COLORS.timer_active,
         )
+        widgets.resume_button.pack_forget()
+        widgets.override_button.pack(pady=40, before=widgets.warning_label)
 
-        # Create Font objects - cast weight to str to avoid type issues
-        self.title_font_obj = tkfont.Font(
-            family=title_font[0],
-            size=title_font[1],
-            weight=str(title_font[2]),  # type: ignore
-        )
-        self.timer_font_obj = tkfont.Font(
-            family=timer_font[0],
-            size=timer_font[1],
-            weight=str(timer_font[2]),  # type: ignore
-        )
-        self.button_font_obj = tkfont.Font(
-            family=button_font[0],
-            size=button_font[1],
-            weight=str(button_font[2]),  # type: ignore
-        )
-        self.warning_font_obj = tkfont.Font(
-            family=warning_font[0],
-            size=warning_font[1],
-            weight=str(warning_font[2]),  # type: ignore
+        # The end of the break gets its own callback at the exact deadline,
+        # so it doesn't depend on when the last per-second tick runs
+        self._complete_after_id = root.after(
+            max(0, int(self._seconds_left() * 1000)), self._show_break_complete
         )
 
-        # Random message with improved styling
-        message = random.choice(self.messages)
-        self.message_label = tk.Label(
+        # Start timer updates
+        self._update_timer_in_thread()
+
+    def _build_widgets(self, root) -> _OverlayWidgets:
+        """Create the overlay's widgets on the shared root."""
+        import tkinter as tk
+
+        colors = self.config.COLORS
+        sizes = self.config.FONT_SIZES
+
+        # Center frame for content
+        center_frame = tk.Frame(root, bg=colors.background)
+        center_frame.place(relx=0.5, rely=0.5, anchor="center")
+
+        # Optimized fonts using the configuration
+        title_font = self._get_font("primary", sizes.title, "bold")
+        timer_font = self._get_font("monospace", sizes.timer, "bold")
+        button_font = self._get_font("primary", sizes.button, "normal")
+        warning_font = self._get_font("primary", sizes.warning, "normal")
+
+        # Random message with improved styling; the text is set per break
+        message_label = tk.Label(
             center_frame,
-            text=message,
-            font=self.title_font_obj,
-            fg=self.config.COLORS["text_primary"],
-            bg=self.config.COLORS["background"],
+            font=title_font,
+            fg=colors.text_primary,
+            bg=colors.background,
             wraplength=900,
             justify="center",
             bd=0,
             highlightthickness=0,
         )
-        self.message_label.pack(pady=30)
+        message_label.pack(pady=30)
 
         # Timer display with improved styling
-        self.timer_label = tk.Label(
+        timer_label = tk.Label(
             center_frame,
-            text=self._format_time_remaining(),
-            font=self.timer_font_obj,
-            fg=self.config.COLORS["timer_active"],
-            bg=self.config.COLORS["background"],
+            font=timer_font,
+            fg=colors.timer_active,
+            bg=colors.background,
             bd=0,
             highlightthickness=0,
         )
-        self.timer_label.pack(pady=20)
+        timer_label.pack(pady=20)
 
         # Override button with modern styling
-        self.override_button = tk.Button(
+        override_button = tk.Button(
             center_frame,
             text="Override Break (Use Sparingly)",
-            font=self.button_font_obj,
-            bg=self.config.COLORS["button_bg"],
-            fg=self.config.COLORS["button_text"],
-            activebackground=self.config.COLORS["button_hover"],
-            activeforeground=self.config.COLORS["button_text"],
+            font=button_font,
+            bg=colors.button_bg,
+            fg=colors.button_text,
+            activebackground=colors.button_hover,
+            activeforeground=colors.button_text,
             padx=30,
             pady=15,
-            command=self._handle_override_in_thread,
+            command=self._on_override_clicked,
             cursor="hand2",
             relief="flat",
             borderwidth=0,
             bd=0,
             highlightthickness=0,
         )
-        self.override_button.pack(pady=40)
+        override_button.pack(pady=40)
 
         # Warning text with improved styling
         warning_label = tk.Label(
             center_frame,
-            text="This overlay will prevent interaction with your system until the break is complete.\n"
-            "Use the override button only when absolutely necessary.",
-            font=self.warning_font_obj,
-            fg=self.config.COLORS["text_secondary"],
-            bg=self.config.COLORS["background"],
+            text=_WARNING_TEXT,
+            font=warning_font,
+            fg=colors.text_secondary,
+            bg=colors.background,
             justify="center",
             wraplength=800,
             bd=0,
@@ -328,8 +506,46 @@ class LinuxBreakOverlay:
         )
         warning_label.pack(pady=10)
 
-        # Start timer updates
-        self._update_timer_in_thread()
+        # Resume button with a distinct green color; only packed once the
+        # break is complete
+        resume_button = tk.Button(
+            center_frame,
+            text="Resume Work",
+            font=button_font,
+            bg=colors.timer_complete,  # Green color
+            fg=colors.button_text,
+            activebackground="#1e8449",  # Darker green on hover
+            activeforeground=colors.button_text,
+            padx=40,
+            pady=20,
+            command=self._on_resume_clicked,
+            cursor="hand2",
+            relief="flat",
+            borderwidth=0,
+            bd=0,
+            highlightthickness=0,
+        )
+
+        return _OverlayWidgets(
+            center_frame,
+            message_label,
+            timer_label,
+            override_button,
+            warning_label,
+            resume_button,
+        )
+
+    @classmethod
+    def _on_override_clicked(cls):
+        """Send an override button click to the overlay being shown."""
+        if cls._active is not None:
+            cls._active._handle_override_in_thread()
+
+    @classmethod
+    def _on_resume_clicked(cls):
+        """Send a resume button click to the overlay being shown."""
+        if cls._active is not None:
+            cls._active._handle_resume()
 
     def _handle_override_in_thread(self):
         """Handle override button click (runs in overlay thread)."""
@@ -343,86 +559,68 @@ class LinuxBreakOverlay:
         # Only hide the overlay if the override was successful
         if override_successful:
             # Request the overlay to quit gracefully
-            # Note: is_showing will be set to False in the finally block of _run_overlay
-            self._should_quit = True
+            # Note: _showing will be cleared in the finally block of _run_overlay
+            self._request_quit()
         else:
             # Override failed - keep overlay active
             self.logger.info("Override was not successful, keeping overlay active")
 
     def _update_timer_in_thread(self):
         """Update the timer display (runs in overlay thread)."""
-        if not self.is_showing or not self.timer_label:
+        if not self._showing.is_set() or not self.timer_label:
             return
 
-        time_remaining = self._get_time_remaining()
+        # Read the clock once per tick; the label and the next delay are
+        # both derived from this value
+        remaining = self._seconds_left()
+        time_remaining = max(0, int(remaining))
+
+        # Update timer display only when the shown value changes, since
+        # every config() call makes Tk re-layout and redraw the label
+        if time_remaining != self._last_displayed_seconds:
+            self._last_displayed_seconds = time_remaining
+            self.timer_label.config(text=self._format_time_remaining(time_remaining))
 
+        # The last second is left to _show_break_complete
         if time_remaining <= 0:
-            # Break time is over - show resume button and wait for user
-            self.timer_label.config(text="00:00")
-            self.timer_label.config(fg=self.config.COLORS["timer_complete"])
-
-            # Update message to indicate break is complete
-            if self.message_label:
-                self.message_label.config(
-                    text="Break complete! Click the button below to resume work."
-                )
-
-            # Hide the override button and show the resume button
-            if self.override_button:
-                self.override_button.pack_forget()
-
-            # Show the resume button if not already shown
-            if not self._resume_button_shown:
-                self._resume_button_shown = True
-                self._show_resume_button()
+            self._timer_after_id = None
+            return
+
+        # Schedule next update just after the displayed second changes, so
+        # the countdown doesn't drift and skip a second over long breaks
+        if self._thread_root is not None:
+            self._timer_after_id = self._thread_root.after(
+                self._ms_until_next_second(remaining), self._update_timer_in_thread
+            )
+
+    def _show_break_complete(self):
+        """Switch the overlay to its break-complete state (runs in overlay thread)."""
+        self._complete_after_id = None
+        if not self._showing.is_set() or not self.timer_label:
             return
 
-        # Update timer display
-        self.timer_label.config(text=self._format_time_remaining())
+        # Break time is over - show resume button and wait for user
+        self.timer_label.config(text="00:00", fg=self.config.COLORS.timer_complete)
 
-        # Schedule next update
-        if hasattr(self, "_thread_root") and self._thread_root:
-            self._thread_root.after(1000, self._update_timer_in_thread)
+        # Update message to indicate break is complete
+        if self.message_label:
+            self.message_label.config(text=_BREAK_COMPLETE_TEXT)
 
-    def _show_resume_button(self):
-        """Show the resume button after break is complete."""
-        if not hasattr(self, "_thread_root") or not self._thread_root:
-            return
+        # Hide the override button and show the resume button
+        if self.override_button:
+            self.override_button.pack_forget()
 
-        # Find the center frame (parent of message_label)
-        center_frame = self.message_label.master if self.message_label else None
-        if not center_frame:
-            return
+        self._show_resume_button()
 
-        # Create the resume button with a distinct green color
-        self.resume_button = tk.Button(
-            center_frame,
-            text="Resume Work",
-            font=self.button_font_obj,
-            bg=self.config.COLORS["timer_complete"],  # Green color
-            fg=self.config.COLORS["button_text"],
-            activebackground="#1e8449",  # Darker green on hover
-            activeforeground=self.config.COLORS["button_text"],
-            padx=40,
-            pady=20,
-            command=self._handle_resume,
-            cursor="hand2",
-            relief="flat",
-            borderwidth=0,
-            bd=0,
-            highlightthickness=0,
-        )
-        self.resume_button.pack(pady=40)
+    def _show_resume_button(self):
+        """Show the resume button after break is complete."""
+        if self.resume_button is not None:
+            self.resume_button.pack(pady=40)
 
     def _handle_resume(self):
         """Handle resume button click after break is complete."""
         self.logger.info("User clicked resume button after break")
-        self._should_quit = True
-
-    def _block_input(self, event):
-        """Block keyboard and mouse input."""
-        # Prevent all input except our override button
-        return "break"
+        self._request_quit()
 
     def _on_closing(self):
         """Handle window close event."""
@@ -431,36 +629,58 @@ class LinuxBreakOverlay:
 
     def is_active(self) -> bool:
         """Check if overlay is currently active."""
-        return self.is_showing
+        return self._showing.is_set()
 
     def hide_overlay(self):
         """Hide the break overlay."""
-        if not self.is_showing:
+        if not self._showing.is_set():
+            return
+
+        self._showing.clear()
+        self._request_quit()
+
+    def _request_quit(self):
+        """Make the overlay mainloop exit.
+
+        On the Tk thread (button handlers, or timer callbacks run while the
+        overlay is up) the mainloop is told to quit directly. From any other
+        thread the quit is queued with after_idle instead.
+        """
+        root = self._thread_root
+        if root is None:
+            # Overlay was never shown or has already been torn down
             return
 
-        self.is_showing = False
-        # Request the overlay to quit gracefully. The after()-driven check
-        # in the mainloop will call root.quit() which ends the mainloop.
+        import tkinter as tk
+
         try:
-            self._should_quit = True
-        except AttributeError:
-            # _should_quit might not exist if overlay was never shown
-            self.logger.debug("_should_quit attribute not found during hide_overlay")
-        except Exception as e:
-            self.logger.error(f"Error setting _should_quit flag: {e}")
+            if threading.get_ident() == self._root_thread:
+                root.quit()
+            else:
+                root.after_idle(root.quit)
+        except (tk.TclError, RuntimeError) as e:
+            self.logger.debug(f"Could not schedule overlay quit: {e}")
+
+    def _seconds_left(self) -> float:
+        """Get the exact remaining time in seconds (negative once over)."""
+        if self._end_time is None:
+            return 0.0
+
+        return self._end_time - time.monotonic()
 
     def _get_time_remaining(self) -> int:
         """Get remaining time in seconds."""
-        if not self.start_time:
-            return 0
+        return max(0, int(self._seconds_left()))
 
-        elapsed = datetime.now() - self.start_time
-        remaining = self.break_duration_seconds - elapsed.total_seconds()
-        return max(0, int(remaining))
+    def _ms_until_next_second(self, remaining: float) -> int:
+        """Get milliseconds until the remaining time drops to the next second."""
+        # +1 so the tick lands after the boundary rather than just before it
+        return int((remaining % 1.0) * 1000) + 1
 
-    def _format_time_remaining(self) -> str:
-        """Format remaining time for display."""
-        seconds = self._get_time_remaining()
+    def _format_time_remaining(self, seconds: Optional[int] = None) -> str:
+        """Format remaining time (by default, the current value) for display."""
+        if seconds is None:
+            seconds = self._get_time_remaining()
         minutes = seconds // 60
         seconds = seconds % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -1,11 +1,36 @@
 """State management for Move Me."""
 
+import atexit
 import json
-from datetime import datetime, date
+import threading
+import time
+from datetime import datetime, date, time as dt_time, timedelta
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+from move_me.utils.fileio import read_json, write_json
 from move_me.utils.logger import get_logger
 
+# Delay before pending state changes are written, so that bursts of updates
+# (e.g. an override followed by a skipped break) result in a single write.
+FLUSH_DELAY_SECONDS = 0.5
+
+# (time.time() of the next local midnight, today's ISO date). Replaced as a
+# whole so threads never see a new deadline paired with yesterday's date.
+_TODAY_CACHE: Tuple[float, str] = (0.0, "")
+
+
+def _today_iso() -> str:
+    """Get today's date as an ISO string, recomputed only after local midnight."""
+    global _TODAY_CACHE
+
+    until, iso = _TODAY_CACHE
+    if time.time() >= until:
+        today = date.today()
+        next_midnight = datetime.combine(today + timedelta(days=1), dt_time.min)
+        iso = today.isoformat()
+        _TODAY_CACHE = (next_midnight.timestamp(), iso)
+    return iso
+
 
 class StateManager:
     """Manages persistent state for the application."""
@@ -13,16 +38,31 @@ class StateManager:
     def __init__(self, state_file: Path):
         self.state_file = state_file
         self.logger = get_logger()
+        # Guards self._state and the flush bookkeeping. Saves run on the
+        # flush timer's thread while the timer mutates state on its own, so
+        # every access to the dict goes through this lock. Re-entrant so the
+        # public methods can call each other.
+        self._lock = threading.RLock()
+        # Held from taking a snapshot until it is written, so an older
+        # snapshot can never overwrite a newer one
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # The directory only needs to be created once, not on every save
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self._state = self._load_state()
 
+        # Make sure deferred changes are written on interpreter shutdown
+        atexit.register(self.flush)
+
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file."""
         if not self.state_file.exists():
             return self._create_default_state()
 
         try:
-            with open(self.state_file, "r") as f:
-                state = json.load(f)
+            state = read_json(self.state_file)
 
             # Validate and migrate state if needed
             return self._validate_state(state)
@@ -58,70 +98,126 @@ class StateManager:
                 state[key] = default_value
 
         # Reset daily counters if it's a new day
-        today = date.today().isoformat()
-        if state.get("last_run_date") != today:
-            state["overrides_used_today"] = 0
-            state["last_run_date"] = today
-            self.logger.info("New day detected, resetting daily counters")
+        self._roll_over_day(state)
 
         return state
 
+    def _roll_over_day(self, state: Dict[str, Any]) -> None:
+        """Reset daily counters if the date has changed since the last run.
+
+        Cheap enough to call on every access: the current date is only
+        recomputed after midnight.
+        """
+        today = _today_iso()
+        last_run_date = state.get("last_run_date")
+        if last_run_date != today:
+            state["overrides_used_today"] = 0
+            state["last_run_date"] = today
+            if last_run_date is not None:
+                self.logger.info("New day detected, resetting daily counters")
+
     def save_state(self) -> None:
         """Save current state to file."""
         try:
-            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._write_lock:
+                with self._lock:
+                    # Update last run date, starting a new day's counters if
+                    # needed, and write a copy so the file is never
+                    # serialized while another thread changes the state.
+                    # All values are scalars, so a shallow copy is enough.
+                    self._roll_over_day(self._state)
+                    snapshot = dict(self._state)
 
-            # Update last run date
-            self._state["last_run_date"] = date.today().isoformat()
-
-            with open(self.state_file, "w") as f:
-                json.dump(self._state, f, indent=2, default=str)
+                write_json(self.state_file, snapshot)
 
             self.logger.debug(f"State saved to {self.state_file}")
 
         except Exception as e:
             self.logger.error(f"Error saving state: {e}")
 
+    def _mark_dirty(self) -> None:
+        """Schedule a deferred save of the current state."""
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_DELAY_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write pending state changes to file, if any."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+
+        self.save_state()
+
     def can_use_override(self, daily_limit: int) -> bool:
         """Check if user can use an override today."""
-        return self._state["overrides_used_today"] < daily_limit
+        with self._lock:
+            self._roll_over_day(self._state)
+            return self._state["overrides_used_today"] < daily_limit
 
     def use_override(self) -> bool:
         """Use one override if available."""
         # Default to allowing override using the stored state; the caller
         # should validate against configured daily limits. Here we simply
-        # increment the counter and persist state.
-        self._state["overrides_used_today"] += 1
-        self._state["total_overrides"] += 1
-        self.save_state()
-        self.logger.info(
-            f"Override used. Total today: {self._state['overrides_used_today']}"
-        )
+        # increment the counter and schedule a save.
+        with self._lock:
+            self._roll_over_day(self._state)
+            self._state["overrides_used_today"] += 1
+            self._state["total_overrides"] += 1
+            used_today = self._state["overrides_used_today"]
+            self._mark_dirty()
+        self.logger.info(f"Override used. Total today: {used_today}")
         return True
 
+    def try_use_override(self, daily_limit: int) -> Optional[int]:
+        """Use one override if the daily limit allows it.
+
+        Returns the number of overrides remaining afterwards, or None if the
+        limit has already been reached.
+        """
+        with self._lock:
+            if not self.can_use_override(daily_limit):
+                return None
+
+            self.use_override()
+            return self.get_overrides_remaining_today(daily_limit)
+
     def record_break_taken(self) -> None:
         """Record that a break was taken."""
-        self._state["total_breaks_taken"] += 1
-        self._state["last_break_time"] = datetime.now().isoformat()
-        self.save_state()
+        with self._lock:
+            self._state["total_breaks_taken"] += 1
+            self._state["last_break_time"] = datetime.now().isoformat()
+            self._mark_dirty()
         self.logger.info("Break taken recorded")
 
     def record_break_skipped(self) -> None:
         """Record that a break was skipped (due to override)."""
-        self._state["total_breaks_skipped"] += 1
-        self.save_state()
+        with self._lock:
+            self._state["total_breaks_skipped"] += 1
+            self._mark_dirty()
         self.logger.info("Break skipped recorded")
 
     def get_overrides_remaining_today(self, daily_limit: int) -> int:
         """Get number of overrides remaining today."""
-        return max(0, daily_limit - self._state["overrides_used_today"])
+        with self._lock:
+            self._roll_over_day(self._state)
+            return max(0, daily_limit - self._state["overrides_used_today"])
 
     def get_stats(self) -> Dict[str, Any]:
         """Get usage statistics."""
-        return {
-            "overrides_used_today": self._state["overrides_used_today"],
-            "total_overrides": self._state["total_overrides"],
-            "total_breaks_taken": self._state["total_breaks_taken"],
-            "total_breaks_skipped": self._state["total_breaks_skipped"],
-            "last_break_time": self._state["last_break_time"],
-        }
+        with self._lock:
+            self._roll_over_day(self._state)
+            return {
+                "overrides_used_today": self._state["overrides_used_today"],
+                "total_overrides": self._state["total_overrides"],
+                "total_breaks_taken": self._state["total_breaks_taken"],
+                "total_breaks_skipped": self._state["total_breaks_skipped"],
+                "last_break_time": self._state["last_break_time"],
+            }
@@ -1,15 +1,46 @@
 """Core timer functionality for managing screen lock cycles."""
 
 import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
+from enum import IntEnum
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Sequence, Tuple
 
 from move_me.core.notifications import NotificationManager
 from move_me.core.state import StateManager
 from move_me.core.overlay import LinuxBreakOverlay
 from move_me.utils.logger import get_logger
 
+# Used when the config doesn't provide any overlay messages
+DEFAULT_OVERLAY_MESSAGES = (
+    "Time to take a break! Your eyes and body need rest.",
+    "Step away from the screen and stretch for a moment.",
+)
+
+
+class TimerState(IntEnum):
+    """States of the break timer."""
+
+    STOPPED = 0
+    WORKING = 1
+    PAUSED = 2
+    IN_BREAK = 3
+
+
+# Allowed (state, event) -> next state transitions; anything else is rejected
+_TRANSITIONS: Dict[Tuple[TimerState, str], TimerState] = {
+    (TimerState.STOPPED, "start"): TimerState.WORKING,
+    (TimerState.WORKING, "pause"): TimerState.PAUSED,
+    (TimerState.PAUSED, "resume"): TimerState.WORKING,
+    (TimerState.WORKING, "start_break"): TimerState.IN_BREAK,
+    (TimerState.PAUSED, "start_break"): TimerState.IN_BREAK,
+    (TimerState.IN_BREAK, "end_break"): TimerState.WORKING,
+    (TimerState.WORKING, "stop"): TimerState.STOPPED,
+    (TimerState.PAUSED, "stop"): TimerState.STOPPED,
+}
+
 
 class TimerManager:
     """Manages the screen locking timer and break cycles."""
@@ -23,13 +54,40 @@ class TimerManager:
         self.overlay = None
         self.logger = get_logger()
 
+        # Settings read once from the config
+        self._work_minutes = float(config.get("work_duration_minutes", 45))
+        self._work_seconds = self._work_minutes * 60
+        self._break_minutes = float(config.get("break_duration_minutes", 5))
+        self._break_seconds = self._break_minutes * 60
+        self._daily_limit: int = config.get("daily_override_limit", 3)
+        self._warning_time: int = config.get("warning_time_seconds", 30)
+        # A warning at or before the start of the work period is pointless
+        self._warning_enabled = 0 < self._warning_time < self._work_seconds
+        self._auto_lock: bool = config.get("auto_lock_enabled", True)
+        self._verbose: bool = config.get("verbose", False)
+        self._overlay_messages: Sequence[str] = tuple(
+            config.get("overlay_messages") or DEFAULT_OVERLAY_MESSAGES
+        )
+
         # Timer state
-        self._running = False
-        self._paused = False
-        self._current_task = None
-        self._next_break_time = None
-        self._break_end_time = None
-        self._in_break = False
+        self._state = TimerState.STOPPED
+        # Deadlines are time.monotonic() values; the datetimes are derived
+        # from them once, for display
+        self._next_break_deadline: Optional[float] = None
+        self._break_end_deadline: Optional[float] = None
+        self._next_break_time: Optional[datetime] = None
+        self._break_end_time: Optional[datetime] = None
+        self._warning_sent = False
+        # Time left until the next break when the timer was paused
+        self._paused_remaining: Optional[float] = None
+        self._break_task: Optional[asyncio.Task] = None
+        # Pending event loop callbacks for the next break, the end of the
+        # current break and the countdown warning
+        self._break_handle: Optional[asyncio.TimerHandle] = None
+        self._end_handle: Optional[asyncio.TimerHandle] = None
+        self._warning_handle: Optional[asyncio.TimerHandle] = None
+        # Set by stop() so callers can wait for the timer to finish
+        self._stopped = asyncio.Event()
 
         # Callbacks
         self._on_break_start = None
@@ -47,24 +105,29 @@ class TimerManager:
         self._on_break_end = on_break_end
         self._on_override_used = on_override_used
 
+    @property
+    def state(self) -> TimerState:
+        """Get the current timer state."""
+        return self._state
+
     @property
     def is_running(self) -> bool:
         """Check if timer is currently running."""
-        return self._running
+        return self._state is not TimerState.STOPPED
 
     @property
     def is_paused(self) -> bool:
         """Check if timer is currently paused."""
-        return self._paused
+        return self._state is TimerState.PAUSED
 
     @property
     def is_in_break(self) -> bool:
         """Check if currently in a break."""
-        return self._in_break
+        return self._state is TimerState.IN_BREAK
 
     @property
     def next_break_time(self) -> Optional[datetime]:
-        """Get the time of the next scheduled break."""
+        """Get the time of the next scheduled break (None while paused)."""
         return self._next_break_time
 
     @property
@@ -74,53 +137,87 @@ class TimerManager:
 
     @property
     def time_until_next_break(self) -> Optional[timedelta]:
-        """Get time remaining until next break."""
-        if not self._next_break_time:
+        """Get time remaining until next break.
+
+        While paused this is the work time that was left at the pause, which
+        doesn't count down until the timer is resumed.
+        """
+        if self._state is TimerState.PAUSED and self._paused_remaining is not None:
+            return timedelta(seconds=self._paused_remaining)
+        if self._next_break_deadline is None:
             return None
-        return max(timedelta(0), self._next_break_time - datetime.now())
+        return timedelta(seconds=max(0.0, self._next_break_deadline - time.monotonic()))
 
     @property
     def time_remaining_in_break(self) -> Optional[timedelta]:
         """Get time remaining in current break."""
-        if not self._break_end_time or not self._in_break:
+        if self._break_end_deadline is None or self._state is not TimerState.IN_BREAK:
             return None
-        return max(timedelta(0), self._break_end_time - datetime.now())
+        return timedelta(seconds=max(0.0, self._break_end_deadline - time.monotonic()))
+
+    def _transition(self, event: str) -> bool:
+        """Move to the state that event leads to, if it is allowed."""
+        next_state = _TRANSITIONS.get((self._state, event))
+        if next_state is None:
+            self.logger.warning(
+                "Cannot %s while %s",
+                event.replace("_", " "),
+                self._state.name.lower().replace("_", " "),
+            )
+            return False
+
+        self._state = next_state
+        return True
 
     def start(self):
         """Start the timer (must be called from an async context)."""
-        if self._running:
-            self.logger.warning("Timer already running")
+        if not self._transition("start"):
             return
 
         self.logger.info("Starting MoveMe timer")
-        self._running = True
-        self._paused = False
+        self._stopped.clear()
+        # Get Tk ready now rather than when the first break starts
+        if self._auto_lock:
+            LinuxBreakOverlay.prewarm()
         self._schedule_next_break()
 
     async def start_async(self):
-        """Start the timer with async task creation."""
+        """Start the timer from a coroutine.
+
+        Breaks are scheduled as event loop callbacks, so there is no
+        separate timer task to start.
+        """
         self.start()
-        # Start the main timer loop
-        self._current_task = asyncio.create_task(self._timer_loop())
-        # Give the task a moment to start
-        await asyncio.sleep(0.1)
+
+    async def wait_stopped(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the timer is stopped.
+
+        Returns True if the timer stopped, or False if the timeout expired
+        first.
+        """
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
 
     def stop(self):
         """Stop the timer."""
-        if not self._running:
+        if self._state is TimerState.STOPPED:
             return
 
         self.logger.info("Stopping MoveMe timer")
-        self._running = False
-
-        if self._current_task:
-            self._current_task.cancel()
-            self._current_task = None
 
         # If in break, end it (this will clean up overlay)
-        if self._in_break:
+        if self._state is TimerState.IN_BREAK:
             self._end_break()
+            self._transition("stop")
+            # Ending the break schedules the next one; drop it again
+            self._cancel_break_timer()
         else:
+            self._transition("stop")
+            self._cancel_break_timer()
+
             # Clean up overlay if it exists but we're not in break
             # (could happen if overlay is stuck)
             if self.overlay:
@@ -128,66 +225,60 @@ class TimerManager:
                     if self.overlay.is_active():
                         self.overlay.hide_overlay()
                 except Exception as e:
-                    self.logger.error(f"Error cleaning up overlay on stop: {e}")
+                    self.logger.error("Error cleaning up overlay on stop: %s", e)
                 finally:
                     self.overlay = None
 
+        self._stopped.set()
+
     def pause(self):
         """Pause the timer (only when not in break)."""
-        if self._in_break:
-            self.logger.warning("Cannot pause during break")
-            return False
-
-        if not self._running:
-            self.logger.warning("Timer not running")
+        if not self._transition("pause"):
             return False
 
         self.logger.info("Pausing timer")
-        self._paused = True
+        self._paused_remaining = max(0.0, self._next_break_deadline - time.monotonic())
+        self._cancel_break_timer()
+        # No break is scheduled until the timer is resumed
+        self._next_break_deadline = None
+        self._next_break_time = None
         return True
 
     def resume(self):
         """Resume the timer."""
-        if not self._running:
-            self.logger.warning("Timer not running")
-            return False
-
-        if not self._paused:
-            self.logger.warning("Timer not paused")
+        if not self._transition("resume"):
             return False
 
         self.logger.info("Resuming timer")
-        self._paused = False
+        # Pick up where the work period left off
+        self._set_break_timer(self._paused_remaining or 0.0)
+        self._paused_remaining = None
         return True
 
     def force_break(self) -> bool:
         """Force an immediate break."""
-        if self._in_break:
-            self.logger.warning("Already in break")
+        if not self._transition("start_break"):
             return False
 
         self.logger.info("Forcing immediate break")
+        self._paused_remaining = None
         # Store the task to prevent garbage collection
         self._break_task = asyncio.create_task(self._start_break())
         return True
 
     def end_break_early(self) -> bool:
         """End the current break early (uses an override)."""
-        if not self._in_break:
+        if self._state is not TimerState.IN_BREAK:
             self.logger.warning("Not currently in break")
             return False
 
-        daily_limit = self.config.get("daily_override_limit", 3)
-
-        # Check if user has overrides available
-        if not self.state_manager.can_use_override(daily_limit):
+        # Use an override if the user has any left
+        if self.state_manager.try_use_override(self._daily_limit) is None:
             self.notification_manager.show_error(
-                f"No overrides remaining. You have used all {daily_limit} overrides today"
+                f"No overrides remaining. You have used all {self._daily_limit} overrides today"
             )
             return False
 
-        # Use an override
-        self.state_manager.use_override()
         self.logger.info("Using override to end break early")
 
         if self._on_override_used:
@@ -198,77 +289,82 @@ class TimerManager:
 
     def _schedule_next_break(self):
         """Schedule the next break."""
-        work_duration = float(self.config.get("work_duration_minutes", 45))
-        self._next_break_time = datetime.now() + timedelta(minutes=work_duration)
-        self.logger.info(
-            f"Next break scheduled for {self._next_break_time.strftime('%H:%M:%S')} ({work_duration:.2f} min)"
-        )
-
-    async def _timer_loop(self):
-        """Main timer loop."""
-        try:
-            while self._running:
-                await asyncio.sleep(1)  # Check every second
-
-                if self._paused:
-                    continue
+        self._warning_sent = False
+        self._set_break_timer(self._work_seconds)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                "Next break scheduled for %s (%.2f min)",
+                self._next_break_time.strftime("%H:%M:%S"),
+                self._work_minutes,
+            )
 
-                # Check if we need to start a break
-                if not self._in_break and self._next_break_time:
-                    if datetime.now() >= self._next_break_time:
-                        await self._start_break()
+    def _set_break_timer(self, delay: float):
+        """Start the next break (and its countdown warning) after delay seconds."""
+        self._cancel_break_timer()
+        self._next_break_deadline = time.monotonic() + delay
+        self._next_break_time = datetime.now() + timedelta(seconds=delay)
+
+        loop = asyncio.get_running_loop()
+        self._break_handle = loop.call_later(delay, self._on_break_due)
+        if self._warning_enabled and not self._warning_sent:
+            self._warning_handle = loop.call_later(
+                max(0.0, delay - self._warning_time), self._send_warning
+            )
 
-                # Check if break should end
-                if self._in_break and self._break_end_time:
-                    if datetime.now() >= self._break_end_time:
-                        self._end_break()
+    def _cancel_break_timer(self):
+        """Cancel the pending break start and countdown warning."""
+        if self._break_handle is not None:
+            self._break_handle.cancel()
+            self._break_handle = None
+        if self._warning_handle is not None:
+            self._warning_handle.cancel()
+            self._warning_handle = None
+
+    def _on_break_due(self):
+        """Start the scheduled break (event loop callback)."""
+        self._break_handle = None
+        if not self._transition("start_break"):
+            return
 
-                # Send countdown notifications
-                self._send_countdown_notifications()
+        # Store the task to prevent garbage collection
+        self._break_task = asyncio.create_task(self._start_break())
 
-        except asyncio.CancelledError:
-            self.logger.info("Timer loop cancelled")
-            raise
-        except Exception as e:
-            self.logger.error(f"Error in timer loop: {e}")
+    def _send_warning(self):
+        """Send the countdown warning (event loop callback)."""
+        self._warning_handle = None
+        self._warning_sent = True
+        self.notification_manager.show_countdown_warning(self._warning_time)
 
     async def _start_break(self):
-        """Start a break."""
+        """Start a break (the caller has already moved to IN_BREAK)."""
         self.logger.info("Starting break")
-        self._in_break = True
+        # A forced break replaces the scheduled one
+        self._cancel_break_timer()
 
-        break_duration = float(self.config.get("break_duration_minutes", 5))
-        self._break_end_time = datetime.now() + timedelta(minutes=break_duration)
+        self._break_end_deadline = time.monotonic() + self._break_seconds
+        self._break_end_time = datetime.now() + timedelta(seconds=self._break_seconds)
+        self._end_handle = asyncio.get_running_loop().call_later(
+            self._break_seconds, self._end_break
+        )
 
         # Show break notification
-        if self.config.get("verbose", False):
-            self.notification_manager.show_break_starting(int(break_duration))
+        if self._verbose:
+            self.notification_manager.show_break_starting(int(self._break_minutes))
 
         if self._on_break_start:
             self._on_break_start()
 
-        # Wait a moment for user to see notification
-        await asyncio.sleep(2)
-
         # Show break overlay
-        if self.config.get("auto_lock_enabled", True):
+        if self._auto_lock:
             try:
-                overlay_messages = self.config.get(
-                    "overlay_messages",
-                    [
-                        "Time to take a break! Your eyes and body need rest.",
-                        "Step away from the screen and stretch for a moment.",
-                    ],
-                )
-                break_duration_seconds = int(break_duration * 60)
                 self.overlay = LinuxBreakOverlay(
-                    messages=overlay_messages,
-                    break_duration_seconds=break_duration_seconds,
+                    messages=self._overlay_messages,
+                    break_duration_seconds=int(self._break_minutes * 60),
                     on_override=self._handle_override,
                 )
                 self.overlay.show_overlay()
             except Exception as e:
-                self.logger.error(f"Error showing break overlay: {e}")
+                self.logger.error("Error showing break overlay: %s", e)
                 self.notification_manager.show_error(f"Break overlay error: {e}")
 
         # Update statistics
@@ -276,12 +372,16 @@ class TimerManager:
 
     def _end_break(self):
         """End the current break."""
-        if not self._in_break:
+        if self._state is not TimerState.IN_BREAK:
             return
 
         self.logger.info("Ending break")
-        self._in_break = False
+        self._transition("end_break")
+        self._break_end_deadline = None
         self._break_end_time = None
+        if self._end_handle is not None:
+            self._end_handle.cancel()
+            self._end_handle = None
 
         # Hide the overlay if it's active
         try:
@@ -290,7 +390,7 @@ class TimerManager:
             # Always clear the overlay reference after hiding
             self.overlay = None
         except Exception as e:
-            self.logger.error(f"Error hiding overlay at break end: {e}")
+            self.logger.error("Error hiding overlay at break end: %s", e)
             # Ensure overlay reference is cleared even on error
             self.overlay = None
 
@@ -298,74 +398,42 @@ class TimerManager:
         self._schedule_next_break()
 
         # Show end notification
-        daily_limit = self.config.get("daily_override_limit", 3)
-        remaining_overrides = self.state_manager.get_overrides_remaining_today(
-            daily_limit
-        )
-
-        if self.config.get("verbose", False):
-            self.notification_manager.show_break_ending()
-            if remaining_overrides > 0:
-                self.notification_manager.show_status(
-                    f"{remaining_overrides} overrides remaining today"
-                )
+        if self._verbose:
+            self.notification_manager.show_break_ending(
+                self.state_manager.get_overrides_remaining_today(self._daily_limit)
+            )
 
         if self._on_break_end:
             self._on_break_end()
 
-    def _send_countdown_notifications(self):
-        """Send countdown notifications before breaks."""
-        if self._in_break or self._paused or not self._next_break_time:
-            return
-
-        time_until_break = self.time_until_next_break
-        if not time_until_break:
-            return
-
-        # Get warning time from config (default to 30 seconds if not set)
-        warning_time = self.config.get("warning_time_seconds", 30)
-        total_seconds = int(time_until_break.total_seconds())
-
-        # Send notification at the configured warning time
-        if total_seconds == warning_time:
-            self.notification_manager.show_countdown_warning(warning_time)
-
     def _handle_override(self):
         """Handle override button click from the break overlay."""
-        daily_limit = self.config.get("daily_override_limit", 3)
-        remaining_overrides = self.state_manager.get_overrides_remaining_today(
-            daily_limit
-        )
-
-        if remaining_overrides > 0:
-            success = self.state_manager.use_override()
-            if success:
-                self.logger.info("Break override used")
-
-                if self._on_override_used:
-                    self._on_override_used()
-
-                # Hide overlay and end break
-                try:
-                    if self.overlay and self.overlay.is_active():
-                        self.overlay.hide_overlay()
-                    # Always clear the overlay reference after hiding
-                    self.overlay = None
-                except Exception as e:
-                    self.logger.error(f"Error hiding overlay after override: {e}")
-                    # Ensure overlay reference is cleared even on error
-                    self.overlay = None
-
-                self._end_break()
+        remaining_overrides = self.state_manager.try_use_override(self._daily_limit)
 
-                self.notification_manager.show_override_used(remaining_overrides - 1)
-                return True  # Override was successful
-            else:
-                self.logger.error("Failed to use override")
-                return False  # Override failed
-        else:
+        if remaining_overrides is None:
             self.logger.warning("Override attempted but daily limit reached")
             self.notification_manager.show_error(
                 "Daily override limit reached. Please complete the break."
             )
             return False  # Override not allowed
+
+        self.logger.info("Break override used")
+
+        if self._on_override_used:
+            self._on_override_used()
+
+        # Hide overlay and end break
+        try:
+            if self.overlay and self.overlay.is_active():
+                self.overlay.hide_overlay()
+            # Always clear the overlay reference after hiding
+            self.overlay = None
+        except Exception as e:
+            self.logger.error("Error hiding overlay after override: %s", e)
+            # Ensure overlay reference is cleared even on error
+            self.overlay = None
+
+        self._end_break()
+
+        self.notification_manager.show_override_used(remaining_overrides)
+        return True  # Override was successful
@@ -139,21 +139,16 @@ def main(
 
 async def run_timer(timer_manager: TimerManager, logger) -> None:
     """Run the timer manager in an async loop."""
-    last_status_time = 0.0
-
     try:
         # Start the timer asynchronously
         await timer_manager.start_async()
 
-        # Wait for the timer to finish (it runs indefinitely)
-        while timer_manager.is_running:
-            await asyncio.sleep(1)
-
-            # Display status updates every 60 seconds
-            current_time = asyncio.get_event_loop().time()
-            if (current_time - last_status_time) >= 60:
-                _display_status(timer_manager, logger)
-                last_status_time = current_time
+        # Wait for the timer to finish (it runs indefinitely), waking up
+        # to display a status update every 60 seconds
+        while True:
+            _display_status(timer_manager, logger)
+            if await timer_manager.wait_stopped(timeout=60):
+                break
 
     except asyncio.CancelledError:
         logger.info("Timer task cancelled")
@@ -168,12 +163,11 @@ def _display_status(timer_manager: TimerManager, logger) -> None:
     if timer_manager.is_in_break:
         remaining = timer_manager.time_remaining_in_break
         if remaining:
-            logger.info(f"In break - {remaining.total_seconds():.0f}s remaining")
+            logger.info("In break - %.0fs remaining", remaining.total_seconds())
     else:
         next_break = timer_manager.time_until_next_break
         if next_break:
-            minutes = next_break.total_seconds() / 60
-            logger.info(f"Next break in {minutes:.0f} minutes")
+            logger.info("Next break in %.0f minutes", next_break.total_seconds() / 60)
 
 
 @app.command()
@@ -190,8 +184,7 @@ def config(
 
     if reset:
         # Reset to defaults
-        default_config = config_manager._load_default_config()
-        config_manager.save_config(default_config)
+        config_manager.save_config(config_manager.default_config)
         typer.echo("Configuration reset to defaults")
         return
 
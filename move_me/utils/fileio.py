@@ -0,0 +1,83 @@
+"""JSON file helpers for Move Me."""
+
+import contextlib
+import json
+import os
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _current_umask() -> int:
+    """Get the process umask (it can only be read by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode for newly created files, as open() would create them. Read once, so
+# write_json never changes the umask while other threads create files.
+_NEW_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def dump_json(obj: Any) -> bytes:
+    """Serialize an object to indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """Read and parse a JSON file.
+
+    Raises json.JSONDecodeError on invalid input (orjson's decode error is
+    a subclass of it).
+    """
+    data = path.read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: Path, obj: Any) -> None:
+    """Serialize an object and atomically replace a JSON file with it.
+
+    The data is written to a temporary file in the same directory and then
+    renamed over the target, so a crash mid-write never leaves a truncated
+    file behind. A symlinked target is followed, so the link is kept, and
+    the file keeps its permissions.
+    """
+    data = dump_json(obj)
+    path = path.resolve()
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _NEW_FILE_MODE
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # mkstemp always creates the file as 0600
+            os.fchmod(f.fileno(), mode)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
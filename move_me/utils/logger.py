@@ -1,57 +1,80 @@
 """Logging configuration for Move Me."""
 
+import functools
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
+
+# Shared by all handlers; the format never changes
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+    style="%",
+)
+
+# (level, log_file) the logger was last set up with
+_CONFIGURED: Optional[Tuple[int, Optional[Path]]] = None
 
 
 def setup_logging(
     log_level: str = "INFO", log_file: Optional[Path] = None
 ) -> logging.Logger:
-    """Set up logging configuration."""
+    """Set up logging configuration.
 
-    # Convert string level to logging level
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
+    Calling it again with the same level and log file leaves the existing
+    handlers in place.
+    """
+    global _CONFIGURED
 
-    level = level_map.get(log_level.upper(), logging.INFO)
+    # Convert string level to logging level
+    level = logging.getLevelNamesMapping().get(log_level.upper(), logging.INFO)
 
     # Create logger
     logger = logging.getLogger("move_me")
+    if _CONFIGURED == (level, log_file):
+        return logger
+
     logger.setLevel(level)
 
-    # Clear any existing handlers
+    # Close and remove any existing handlers
+    for handler in logger.handlers:
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
     logger.handlers.clear()
 
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
 
     # File handler (if specified)
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        # The file is opened on the first record that reaches it, and
+        # records are written in batches; anything at WARNING or above is
+        # written straight away. logging.shutdown() flushes the rest at exit.
+        file_handler = logging.FileHandler(log_file, delay=True, encoding="utf-8")
+        file_handler.setFormatter(_FORMATTER)
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=64, flushLevel=logging.WARNING, target=file_handler
+        )
+        buffered_handler.setLevel(level)
+        logger.addHandler(buffered_handler)
 
+    _CONFIGURED = (level, log_file)
     return logger
 
 
+@functools.lru_cache(maxsize=1)
 def get_logger() -> logging.Logger:
-    """Get the Move Me logger."""
+    """Get the Move Me logger.
+
+    Cached, since the logger object never changes; setup_logging() only
+    reconfigures it.
+    """
     return logging.getLogger("move_me")
@@ -0,0 +1,62 @@
+"""Tests for configuration validation."""
+
+import pytest
+
+from move_me.config.manager import ConfigManager
+
+VALID = {
+    "work_duration_minutes": 45,
+    "break_duration_minutes": 0.5,
+    "warning_time_seconds": 30,
+    "daily_override_limit": 3,
+}
+
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    """A ConfigManager whose config directory is under tmp_path."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return ConfigManager()
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"daily_override_limit": 0},
+        {"daily_override_limit": 3.0},
+        {"work_duration_minutes": 0.1},
+    ],
+)
+def test_valid_configs(config_manager, capsys, changes):
+    """Positive numbers and integral limits are accepted."""
+    assert config_manager.validate_config({**VALID, **changes})
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    ("changes", "key"),
+    [
+        ({"daily_override_limit": 2.5}, "daily_override_limit"),
+        ({"daily_override_limit": True}, "daily_override_limit"),
+        ({"daily_override_limit": -1}, "daily_override_limit"),
+        ({"work_duration_minutes": True}, "work_duration_minutes"),
+        ({"work_duration_minutes": 0}, "work_duration_minutes"),
+        ({"work_duration_minutes": float("nan")}, "work_duration_minutes"),
+        ({"break_duration_minutes": "5"}, "break_duration_minutes"),
+        ({"warning_time_seconds": None}, "warning_time_seconds"),
+    ],
+)
+def test_invalid_configs(config_manager, capsys, changes, key):
+    """Out-of-range values, booleans and non-numbers are rejected by name."""
+    assert not config_manager.validate_config({**VALID, **changes})
+    assert f"Error: {key} must be" in capsys.readouterr().out
+
+
+def test_missing_key_is_reported(config_manager, capsys):
+    """A missing required setting is named in the error."""
+    config = dict(VALID)
+    del config["break_duration_minutes"]
+
+    assert not config_manager.validate_config(config)
+    assert "break_duration_minutes" in capsys.readouterr().out
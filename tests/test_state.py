@@ -0,0 +1,143 @@
+"""Tests for persistent state management."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from move_me.core import state
+from move_me.core.state import StateManager
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Count state file writes, and keep the deferred flush from firing."""
+    monkeypatch.setattr(state, "FLUSH_DELAY_SECONDS", 60)
+    calls = []
+    write_json = state.write_json
+
+    def counting_write_json(path, obj):
+        calls.append(path)
+        write_json(path, obj)
+
+    monkeypatch.setattr(state, "write_json", counting_write_json)
+    return calls
+
+
+def read_state(path):
+    return json.loads(path.read_text())
+
+
+def test_burst_of_changes_is_written_once(tmp_path, writes):
+    """Changes are coalesced until flush, which leaves the file current."""
+    state_file = tmp_path / "state.json"
+    manager = StateManager(state_file)
+
+    manager.use_override()
+    manager.record_break_skipped()
+    manager.record_break_taken()
+    manager.record_break_taken()
+    assert writes == []
+
+    manager.flush()
+    assert writes == [state_file]
+    saved = read_state(state_file)
+    assert saved["overrides_used_today"] == 1
+    assert saved["total_overrides"] == 1
+    assert saved["total_breaks_skipped"] == 1
+    assert saved["total_breaks_taken"] == 2
+
+    # Nothing pending, so nothing more to write
+    manager.flush()
+    assert len(writes) == 1
+
+
+def test_concurrent_changes_while_saving(tmp_path, monkeypatch):
+    """Saving from another thread never loses or tears an update."""
+    state_file = tmp_path / "state.json"
+    manager = StateManager(state_file)
+    done = threading.Event()
+    torn = []
+    saves = []
+    write_json = state.write_json
+
+    def slow_write_json(path, obj):
+        # Serialize one item at a time, giving other threads a chance to
+        # change the dict part way through
+        copied = {}
+        for key, value in obj.items():
+            copied[key] = value
+            time.sleep(0)
+        if copied["overrides_used_today"] != copied["total_overrides"]:
+            torn.append(copied)
+        saves.append(copied)
+        write_json(path, copied)
+
+    monkeypatch.setattr(state, "write_json", slow_write_json)
+
+    def keep_saving():
+        while not done.is_set():
+            manager.save_state()
+
+    saver = threading.Thread(target=keep_saving)
+    saver.start()
+    changes = 0
+    try:
+        # Keep changing the state until plenty of saves have overlapped
+        while changes < 2000 or len(saves) < 20:
+            manager.record_break_taken()
+            manager.try_use_override(daily_limit=10**6)
+            changes += 1
+    finally:
+        done.set()
+        saver.join()
+    manager.flush()
+
+    assert torn == []
+    saved = read_state(state_file)
+    assert saved["total_breaks_taken"] == changes
+    assert saved["overrides_used_today"] == changes
+    assert saved["total_overrides"] == changes
+
+
+def test_try_use_override_stops_at_limit(tmp_path, writes):
+    """Overrides are counted down and refused once the limit is reached."""
+    manager = StateManager(tmp_path / "state.json")
+
+    assert manager.try_use_override(daily_limit=2) == 1
+    assert manager.try_use_override(daily_limit=2) == 0
+    assert manager.try_use_override(daily_limit=2) is None
+    assert manager.get_stats()["overrides_used_today"] == 2
+
+
+def test_stale_date_in_file_resets_daily_overrides(tmp_path, writes):
+    """A state file from an earlier day starts with no overrides used."""
+    state_file = tmp_path / "state.json"
+    state_file.write_text(
+        json.dumps(
+            {
+                "last_run_date": "2000-01-01",
+                "overrides_used_today": 3,
+                "total_overrides": 7,
+            }
+        )
+    )
+
+    manager = StateManager(state_file)
+
+    assert manager.get_overrides_remaining_today(daily_limit=3) == 3
+    assert manager.get_stats()["total_overrides"] == 7
+
+
+def test_day_rollover_while_running(tmp_path, writes):
+    """Crossing midnight resets the daily count on the next access."""
+    manager = StateManager(tmp_path / "state.json")
+    manager.try_use_override(daily_limit=1)
+    assert not manager.can_use_override(daily_limit=1)
+
+    # As if the last access had been on an earlier day
+    manager._state["last_run_date"] = "2000-01-01"
+
+    assert manager.can_use_override(daily_limit=1)
+    assert manager.get_stats()["overrides_used_today"] == 0
@@ -0,0 +1,154 @@
+"""Tests for the break timer's state machine and scheduling."""
+
+import asyncio
+
+import pytest
+
+from move_me.core.timer import TimerManager, TimerState
+
+# Sub-second cycles: 0.3s of work, 0.3s breaks, warning 0.1s before a break
+CONFIG = {
+    "work_duration_minutes": 0.005,
+    "break_duration_minutes": 0.005,
+    "warning_time_seconds": 0.1,
+    "daily_override_limit": 3,
+    "auto_lock_enabled": False,
+}
+
+
+@pytest.fixture
+def make_timer(tmp_path):
+    """Build a TimerManager that records warnings instead of notifying."""
+
+    def make():
+        timer = TimerManager(dict(CONFIG), tmp_path / "state.json")
+        timer.warnings = []
+        timer.notification_manager.show_countdown_warning = timer.warnings.append
+        return timer
+
+    return make
+
+
+def assert_no_break_pending(timer):
+    assert timer._break_handle is None
+    assert timer._warning_handle is None
+
+
+def test_work_break_cycle(make_timer):
+    """The timer moves WORKING -> IN_BREAK -> WORKING, then stops."""
+
+    async def run():
+        timer = make_timer()
+        states = []
+        timer.set_callbacks(
+            on_break_start=lambda: states.append(timer.state),
+            on_break_end=lambda: states.append(timer.state),
+        )
+
+        timer.start()
+        states.append(timer.state)
+        await asyncio.sleep(0.45)
+        assert timer.is_in_break
+        await asyncio.sleep(0.3)
+        timer.stop()
+        states.append(timer.state)
+
+        assert await timer.wait_stopped(timeout=1)
+        assert_no_break_pending(timer)
+        assert timer._end_handle is None
+        return states, timer.warnings
+
+    states, warnings = asyncio.run(run())
+    assert states == [
+        TimerState.WORKING,
+        TimerState.IN_BREAK,
+        TimerState.WORKING,
+        TimerState.STOPPED,
+    ]
+    # One warning for the work period that ended in a break
+    assert warnings == [0.1]
+
+
+def test_rejected_transitions(make_timer):
+    """Calls that don't apply to the current state are refused."""
+
+    async def run():
+        timer = make_timer()
+        assert not timer.force_break()
+        assert not timer.pause()
+        assert not timer.resume()
+        assert timer.state is TimerState.STOPPED
+
+        timer.start()
+        assert not timer.resume()
+        assert timer.pause()
+        assert not timer.pause()
+        assert timer.state is TimerState.PAUSED
+        timer.stop()
+        assert timer.state is TimerState.STOPPED
+
+    asyncio.run(run())
+
+
+def test_stop_cancels_scheduled_break(make_timer):
+    """Stopping cancels the pending break and warning."""
+
+    async def run():
+        timer = make_timer()
+        timer.start()
+        assert timer._break_handle is not None
+        assert timer._warning_handle is not None
+
+        timer.stop()
+        assert_no_break_pending(timer)
+        await asyncio.sleep(0.45)
+        assert timer.state is TimerState.STOPPED
+        return timer.warnings
+
+    assert asyncio.run(run()) == []
+
+
+def test_pause_holds_break_until_resume(make_timer):
+    """Pausing cancels the break; resuming schedules the rest of the work time."""
+
+    async def run():
+        timer = make_timer()
+        timer.start()
+        await asyncio.sleep(0.1)
+        assert timer.pause()
+        assert_no_break_pending(timer)
+        paused_left = timer.time_until_next_break
+
+        # Well past the original deadline, and the countdown hasn't moved
+        await asyncio.sleep(0.4)
+        assert timer.state is TimerState.PAUSED
+        assert timer.time_until_next_break == paused_left
+
+        assert timer.resume()
+        assert timer._break_handle is not None
+        await asyncio.sleep(paused_left.total_seconds() + 0.1)
+        assert timer.is_in_break
+        timer.stop()
+        return timer.warnings
+
+    assert asyncio.run(run()) == [0.1]
+
+
+def test_forced_break_replaces_scheduled_break(make_timer):
+    """A forced break cancels the scheduled one and its warning."""
+
+    async def run():
+        timer = make_timer()
+        timer.start()
+        assert timer.force_break()
+        assert timer.is_in_break
+        await asyncio.sleep(0)
+        assert_no_break_pending(timer)
+        assert timer._end_handle is not None
+
+        await asyncio.sleep(0.35)
+        assert timer.state is TimerState.WORKING
+        timer.stop()
+        return timer.warnings
+
+    assert asyncio.run(run()) == []